@@ -1,4 +1,5 @@
 use clap::Parser;
+use std::io::{BufWriter, Write};
 use std::path::PathBuf;
 
 use rusty_boy::disassembler::Disassembler;
@@ -20,28 +21,33 @@ fn main() -> anyhow::Result<()> {
     let header = disassembler
         .header()
         .map_err(|e| anyhow::format_err!("{e:?}"))?;
-    println!("Rom Header:");
-    println!("\tTitle: \"{}\"", header.title);
-    println!("\tManufacturer code: {:?}", header.manufacturer_code);
-    println!("\tCGB: {:?}", header.cgb_flag);
+    // There is one line per instruction, so avoid flushing stdout on each of them
+    let mut out = BufWriter::new(std::io::stdout().lock());
+
+    writeln!(out, "Rom Header:")?;
+    writeln!(out, "\tTitle: \"{}\"", header.title)?;
+    writeln!(out, "\tManufacturer code: {:?}", header.manufacturer_code)?;
+    writeln!(out, "\tCGB: {:?}", header.cgb_flag)?;
     assert_eq!(header.rom_size % (32 * 1024), 0);
-    println!("\tROM size: {} KiB", header.rom_size / 1024);
-    println!("\tRAM size: {}", header.ram_size);
-    println!("\tType: {}", header.cartridge_type);
-    println!("\tEntrypoint:");
+    writeln!(out, "\tROM size: {} KiB", header.rom_size / 1024)?;
+    writeln!(out, "\tRAM size: {}", header.ram_size)?;
+    writeln!(out, "\tType: {}", header.cartridge_type)?;
+    writeln!(out, "\tEntrypoint:")?;
     for (addr, insn) in disassembler
         .entrypoint()
         .map_err(|e| anyhow::format_err!("{e:?}"))?
     {
-        println!("\t\t{:#x}\t{}", addr, insn);
+        writeln!(out, "\t\t{:#x}\t{}", addr, insn)?;
     }
 
     for (addr, insn) in disassembler
         .disassemble()
         .map_err(|e| anyhow::format_err!("{e:?}"))?
     {
-        println!("{:#x}\t{}", addr, insn);
+        writeln!(out, "{:#x}\t{}", addr, insn)?;
     }
 
+    out.flush()?;
+
     Ok(())
 }
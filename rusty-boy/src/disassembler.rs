@@ -175,6 +175,55 @@ pub enum Instruction {
 }
 
 impl Instruction {
+    fn mnemonic(&self) -> &'static str {
+        match self {
+            Instruction::Ld8(..) | Instruction::Ld16(..) | Instruction::Ld16HlSpImm(_) => "ld",
+            Instruction::Add8(..) | Instruction::Add16(..) | Instruction::AddSpImm(_) => "add",
+            Instruction::Sub8(..) => "sub",
+            Instruction::And8(..) => "and",
+            Instruction::Or8(..) => "or",
+            Instruction::Adc8(..) => "adc",
+            Instruction::Sbc8(..) => "sbc",
+            Instruction::Xor8(..) => "xor",
+            Instruction::Cp8(..) => "cp",
+            Instruction::Inc8(_) | Instruction::Inc16(_) => "inc",
+            Instruction::Dec8(_) | Instruction::Dec16(_) => "dec",
+            Instruction::JrImm(..) => "jr",
+            Instruction::Ret(_) => "ret",
+            Instruction::Reti => "reti",
+            Instruction::JpImm(..) | Instruction::JpHl => "jp",
+            Instruction::CallImm(..) => "call",
+            Instruction::Reset(_) => "rst",
+            Instruction::Pop(_) => "pop",
+            Instruction::Push(_) => "push",
+            Instruction::Di => "di",
+            Instruction::Ei => "ei",
+            Instruction::Halt => "halt",
+            Instruction::Nop => "nop",
+            Instruction::Rlca => "rlca",
+            Instruction::Rrca => "rrca",
+            Instruction::Rla => "rla",
+            Instruction::Rra => "rra",
+            Instruction::Daa => "daa",
+            Instruction::Cpl => "cpl",
+            Instruction::Scf => "scf",
+            Instruction::Ccf => "ccf",
+            Instruction::Stop => "stop",
+            Instruction::Rlc(_) => "rlc",
+            Instruction::Rrc(_) => "rrc",
+            Instruction::Rl(_) => "rl",
+            Instruction::Rr(_) => "rr",
+            Instruction::Sla(_) => "sla",
+            Instruction::Sra(_) => "sra",
+            Instruction::Swap(_) => "swap",
+            Instruction::Srl(_) => "srl",
+            Instruction::Bit(..) => "bit",
+            Instruction::Res(..) => "res",
+            Instruction::Set(..) => "set",
+            Instruction::Illegal => "unk",
+        }
+    }
+
     fn reg_to_repr(reg: Register) -> &'static str {
         match reg {
             Register::A => "A",
@@ -247,100 +296,83 @@ impl Instruction {
             }
             AddressingMode::IndirectImmediate(imm) => write!(f, "[{:#x}]", imm),
             AddressingMode::IndirectZeroPageImmediate(imm) => write!(f, "[0xFF00 + {:#x}]", imm),
-            AddressingMode::Register(reg) => write!(f, "{}", Self::reg_to_repr(*reg)),
-            AddressingMode::RegisterPair(reg) => write!(f, "{}", Self::reg_pair_to_repr(*reg)),
+            AddressingMode::Register(reg) => f.write_str(Self::reg_to_repr(*reg)),
+            AddressingMode::RegisterPair(reg) => f.write_str(Self::reg_pair_to_repr(*reg)),
             AddressingMode::Immediate(imm) => write!(f, "{:#x}", imm),
             AddressingMode::Immediate16(imm) => write!(f, "{:#x}", imm),
         }
     }
+
+    fn format_one_operand(
+        f: &mut core::fmt::Formatter<'_>,
+        mnemonic: &str,
+        mode: &AddressingMode,
+    ) -> core::fmt::Result {
+        f.write_str(mnemonic)?;
+        f.write_str(" ")?;
+        Self::format_addr_mode(f, mode)
+    }
+
+    fn format_two_operands(
+        f: &mut core::fmt::Formatter<'_>,
+        mnemonic: &str,
+        dest: &AddressingMode,
+        src: &AddressingMode,
+    ) -> core::fmt::Result {
+        f.write_str(mnemonic)?;
+        f.write_str(" ")?;
+        Self::format_addr_mode(f, dest)?;
+        f.write_str(" ")?;
+        Self::format_addr_mode(f, src)
+    }
 }
 
 impl core::fmt::Display for Instruction {
     fn fmt(&self, f: &mut core::fmt::Formatter<'_>) -> core::fmt::Result {
         match self {
-            Instruction::Ld8(dest, src) | Instruction::Ld16(dest, src) => {
-                write!(f, "ld ")?;
-                Self::format_addr_mode(f, dest)?;
-                write!(f, " ")?;
-                Self::format_addr_mode(f, src)
-            }
-            Instruction::Add8(dest, src) | Instruction::Add16(dest, src) => {
-                write!(f, "add ")?;
-                Self::format_addr_mode(f, dest)?;
-                write!(f, " ")?;
-                Self::format_addr_mode(f, src)
-            }
-            Instruction::Sub8(dest, src) => {
-                write!(f, "sub ")?;
-                Self::format_addr_mode(f, dest)?;
-                write!(f, " ")?;
-                Self::format_addr_mode(f, src)
-            }
-            Instruction::And8(dest, src) => {
-                write!(f, "and ")?;
-                Self::format_addr_mode(f, dest)?;
-                write!(f, " ")?;
-                Self::format_addr_mode(f, src)
-            }
-            Instruction::Or8(dest, src) => {
-                write!(f, "or ")?;
-                Self::format_addr_mode(f, dest)?;
-                write!(f, " ")?;
-                Self::format_addr_mode(f, src)
-            }
-            Instruction::Adc8(dest, src) => {
-                write!(f, "adc ")?;
-                Self::format_addr_mode(f, dest)?;
-                write!(f, " ")?;
-                Self::format_addr_mode(f, src)
-            }
-            Instruction::Sbc8(dest, src) => {
-                write!(f, "sbc ")?;
-                Self::format_addr_mode(f, dest)?;
-                write!(f, " ")?;
-                Self::format_addr_mode(f, src)
-            }
-            Instruction::Xor8(dest, src) => {
-                write!(f, "xor ")?;
-                Self::format_addr_mode(f, dest)?;
-                write!(f, " ")?;
-                Self::format_addr_mode(f, src)
-            }
-            Instruction::Cp8(dest, src) => {
-                write!(f, "cp ")?;
-                Self::format_addr_mode(f, dest)?;
-                write!(f, " ")?;
-                Self::format_addr_mode(f, src)
-            }
-            Instruction::Inc8(mode) | Instruction::Inc16(mode) => {
-                write!(f, "inc ")?;
-                Self::format_addr_mode(f, mode)
-            }
-            Instruction::Dec8(mode) | Instruction::Dec16(mode) => {
-                write!(f, "dec ")?;
-                Self::format_addr_mode(f, mode)
-            }
+            Instruction::Ld8(dest, src)
+            | Instruction::Ld16(dest, src)
+            | Instruction::Add8(dest, src)
+            | Instruction::Add16(dest, src)
+            | Instruction::Sub8(dest, src)
+            | Instruction::And8(dest, src)
+            | Instruction::Or8(dest, src)
+            | Instruction::Adc8(dest, src)
+            | Instruction::Sbc8(dest, src)
+            | Instruction::Xor8(dest, src)
+            | Instruction::Cp8(dest, src) => {
+                Self::format_two_operands(f, self.mnemonic(), dest, src)
+            }
+            Instruction::Inc8(mode)
+            | Instruction::Inc16(mode)
+            | Instruction::Dec8(mode)
+            | Instruction::Dec16(mode)
+            | Instruction::Rlc(mode)
+            | Instruction::Rrc(mode)
+            | Instruction::Rl(mode)
+            | Instruction::Rr(mode)
+            | Instruction::Sla(mode)
+            | Instruction::Sra(mode)
+            | Instruction::Swap(mode)
+            | Instruction::Srl(mode) => Self::format_one_operand(f, self.mnemonic(), mode),
+            Instruction::Halt
+            | Instruction::Nop
+            | Instruction::Daa
+            | Instruction::Cpl
+            | Instruction::Scf
+            | Instruction::Ccf
+            | Instruction::Stop
+            | Instruction::Reti
+            | Instruction::Di
+            | Instruction::Ei
+            | Instruction::Rlca
+            | Instruction::Rrca
+            | Instruction::Rla
+            | Instruction::Rra
+            | Instruction::Illegal => f.write_str(self.mnemonic()),
             Instruction::Ld16HlSpImm(imm) => {
                 write!(f, "ld HL, SP + {}", *imm)
             }
-            Instruction::Halt => {
-                write!(f, "halt")
-            }
-            Instruction::Nop => {
-                write!(f, "nop")
-            }
-            Instruction::Daa => {
-                write!(f, "daa")
-            }
-            Instruction::Cpl => {
-                write!(f, "cpl")
-            }
-            Instruction::Scf => {
-                write!(f, "scf")
-            }
-            Instruction::Ccf => {
-                write!(f, "ccf")
-            }
             Instruction::JrImm(condition, imm) => {
                 if let Some(cond) = condition {
                     write!(f, "jr {}, PC + {}", Self::cond_to_repr(*cond), *imm)
@@ -348,19 +380,13 @@ impl core::fmt::Display for Instruction {
                     write!(f, "jr PC + {}", *imm)
                 }
             }
-            Instruction::Stop => {
-                write!(f, "stop")
-            }
             Instruction::Ret(cond) => {
                 if let Some(cond) = cond {
                     write!(f, "ret {}", Self::cond_to_repr(*cond))
                 } else {
-                    write!(f, "ret ")
+                    f.write_str("ret ")
                 }
             }
-            Instruction::Reti => {
-                write!(f, "reti")
-            }
             Instruction::JpImm(cond, imm) => {
                 if let Some(cond) = cond {
                     write!(f, "jp {}, {:#x}", Self::cond_to_repr(*cond), imm)
@@ -368,9 +394,7 @@ impl core::fmt::Display for Instruction {
                     write!(f, "jp {:#x}", imm)
                 }
             }
-            Instruction::JpHl => {
-                write!(f, "jp HL")
-            }
+            Instruction::JpHl => f.write_str("jp HL"),
             Instruction::CallImm(cond, imm) => {
                 if let Some(cond) = cond {
                     write!(f, "call {}, {:#x}", Self::cond_to_repr(*cond), imm)
@@ -387,69 +411,10 @@ impl core::fmt::Display for Instruction {
             Instruction::Push(reg) => {
                 write!(f, "push {}", Self::reg_pair_to_repr(*reg))
             }
-            Instruction::Di => {
-                write!(f, "di")
-            }
-            Instruction::Ei => {
-                write!(f, "ei")
-            }
-            Instruction::Illegal => {
-                write!(f, "unk")
-            }
-            Instruction::Rlca => {
-                write!(f, "rlca")
-            }
-            Instruction::Rrca => {
-                write!(f, "rrca")
-            }
-            Instruction::Rla => {
-                write!(f, "rla")
-            }
-            Instruction::Rra => {
-                write!(f, "rra")
-            }
-            Instruction::Bit(bit, mode) => {
-                write!(f, "bit {}, ", Self::bit_to_repr(*bit),)?;
-                Self::format_addr_mode(f, mode)
-            }
-            Instruction::Res(bit, mode) => {
-                write!(f, "res {}, ", Self::bit_to_repr(*bit),)?;
-                Self::format_addr_mode(f, mode)
-            }
-            Instruction::Set(bit, mode) => {
-                write!(f, "set {}, ", Self::bit_to_repr(*bit),)?;
-                Self::format_addr_mode(f, mode)
-            }
-            Instruction::Rlc(mode) => {
-                write!(f, "rlc ")?;
-                Self::format_addr_mode(f, mode)
-            }
-            Instruction::Rrc(mode) => {
-                write!(f, "rrc ")?;
-                Self::format_addr_mode(f, mode)
-            }
-            Instruction::Rl(mode) => {
-                write!(f, "rl ")?;
-                Self::format_addr_mode(f, mode)
-            }
-            Instruction::Rr(mode) => {
-                write!(f, "rr ")?;
-                Self::format_addr_mode(f, mode)
-            }
-            Instruction::Sla(mode) => {
-                write!(f, "sla ")?;
-                Self::format_addr_mode(f, mode)
-            }
-            Instruction::Sra(mode) => {
-                write!(f, "sra ")?;
-                Self::format_addr_mode(f, mode)
-            }
-            Instruction::Swap(mode) => {
-                write!(f, "swap ")?;
-                Self::format_addr_mode(f, mode)
-            }
-            Instruction::Srl(mode) => {
-                write!(f, "srl ")?;
+            Instruction::Bit(bit, mode)
+            | Instruction::Res(bit, mode)
+            | Instruction::Set(bit, mode) => {
+                write!(f, "{} {}, ", self.mnemonic(), Self::bit_to_repr(*bit))?;
                 Self::format_addr_mode(f, mode)
             }
             Instruction::AddSpImm(imm) => {
@@ -494,6 +459,10 @@ where
         Some(next)
     }
 
+    fn read_addr_mode(&mut self, mode: sm83::decoder::AddressingMode) -> AddressingMode {
+        translate_addr_mode(&mut self.iter, mode)
+    }
+
     fn read_16_bit_imm(&mut self) -> Option<u16> {
         let lo = self.iter.next()?;
         let hi = self.iter.next()?;
@@ -518,62 +487,43 @@ where
         };
 
         let insn = match decoded {
-            sm83::decoder::OpCode::Ld8(dest, src) => Instruction::Ld8(
-                translate_addr_mode(&mut self.iter, dest),
-                translate_addr_mode(&mut self.iter, src),
-            ),
-            sm83::decoder::OpCode::Ld16(dest, src) => Instruction::Ld16(
-                translate_addr_mode(&mut self.iter, dest),
-                translate_addr_mode(&mut self.iter, src),
-            ),
-            sm83::decoder::OpCode::Add8(dest, src) => Instruction::Add8(
-                translate_addr_mode(&mut self.iter, dest),
-                translate_addr_mode(&mut self.iter, src),
-            ),
-            sm83::decoder::OpCode::Sub8(dest, src) => Instruction::Sub8(
-                translate_addr_mode(&mut self.iter, dest),
-                translate_addr_mode(&mut self.iter, src),
-            ),
-            sm83::decoder::OpCode::And8(dest, src) => Instruction::And8(
-                translate_addr_mode(&mut self.iter, dest),
-                translate_addr_mode(&mut self.iter, src),
-            ),
-            sm83::decoder::OpCode::Or8(dest, src) => Instruction::Or8(
-                translate_addr_mode(&mut self.iter, dest),
-                translate_addr_mode(&mut self.iter, src),
-            ),
-            sm83::decoder::OpCode::Adc8(dest, src) => Instruction::Adc8(
-                translate_addr_mode(&mut self.iter, dest),
-                translate_addr_mode(&mut self.iter, src),
-            ),
-            sm83::decoder::OpCode::Sbc8(dest, src) => Instruction::Sbc8(
-                translate_addr_mode(&mut self.iter, dest),
-                translate_addr_mode(&mut self.iter, src),
-            ),
-            sm83::decoder::OpCode::Xor8(dest, src) => Instruction::Xor8(
-                translate_addr_mode(&mut self.iter, dest),
-                translate_addr_mode(&mut self.iter, src),
-            ),
-            sm83::decoder::OpCode::Cp8(dest, src) => Instruction::Cp8(
-                translate_addr_mode(&mut self.iter, dest),
-                translate_addr_mode(&mut self.iter, src),
-            ),
-            sm83::decoder::OpCode::Add16(dest, src) => Instruction::Add16(
-                translate_addr_mode(&mut self.iter, dest),
-                translate_addr_mode(&mut self.iter, src),
-            ),
-            sm83::decoder::OpCode::Inc8(mode) => {
-                Instruction::Inc8(translate_addr_mode(&mut self.iter, mode))
-            }
-            sm83::decoder::OpCode::Dec8(mode) => {
-                Instruction::Dec8(translate_addr_mode(&mut self.iter, mode))
-            }
-            sm83::decoder::OpCode::Inc16(mode) => {
-                Instruction::Inc16(translate_addr_mode(&mut self.iter, mode))
-            }
-            sm83::decoder::OpCode::Dec16(mode) => {
-                Instruction::Dec16(translate_addr_mode(&mut self.iter, mode))
+            sm83::decoder::OpCode::Ld8(dest, src) => {
+                Instruction::Ld8(self.read_addr_mode(dest), self.read_addr_mode(src))
             }
+            sm83::decoder::OpCode::Ld16(dest, src) => {
+                Instruction::Ld16(self.read_addr_mode(dest), self.read_addr_mode(src))
+            }
+            sm83::decoder::OpCode::Add8(dest, src) => {
+                Instruction::Add8(self.read_addr_mode(dest), self.read_addr_mode(src))
+            }
+            sm83::decoder::OpCode::Sub8(dest, src) => {
+                Instruction::Sub8(self.read_addr_mode(dest), self.read_addr_mode(src))
+            }
+            sm83::decoder::OpCode::And8(dest, src) => {
+                Instruction::And8(self.read_addr_mode(dest), self.read_addr_mode(src))
+            }
+            sm83::decoder::OpCode::Or8(dest, src) => {
+                Instruction::Or8(self.read_addr_mode(dest), self.read_addr_mode(src))
+            }
+            sm83::decoder::OpCode::Adc8(dest, src) => {
+                Instruction::Adc8(self.read_addr_mode(dest), self.read_addr_mode(src))
+            }
+            sm83::decoder::OpCode::Sbc8(dest, src) => {
+                Instruction::Sbc8(self.read_addr_mode(dest), self.read_addr_mode(src))
+            }
+            sm83::decoder::OpCode::Xor8(dest, src) => {
+                Instruction::Xor8(self.read_addr_mode(dest), self.read_addr_mode(src))
+            }
+            sm83::decoder::OpCode::Cp8(dest, src) => {
+                Instruction::Cp8(self.read_addr_mode(dest), self.read_addr_mode(src))
+            }
+            sm83::decoder::OpCode::Add16(dest, src) => {
+                Instruction::Add16(self.read_addr_mode(dest), self.read_addr_mode(src))
+            }
+            sm83::decoder::OpCode::Inc8(mode) => Instruction::Inc8(self.read_addr_mode(mode)),
+            sm83::decoder::OpCode::Dec8(mode) => Instruction::Dec8(self.read_addr_mode(mode)),
+            sm83::decoder::OpCode::Inc16(mode) => Instruction::Inc16(self.read_addr_mode(mode)),
+            sm83::decoder::OpCode::Dec16(mode) => Instruction::Dec16(self.read_addr_mode(mode)),
             sm83::decoder::OpCode::JrImm(cond) => {
                 Instruction::JrImm(cond, self.read_8_bit_imm()? as i8)
             }
@@ -606,38 +556,22 @@ where
             sm83::decoder::OpCode::Ccf => Instruction::Ccf,
             sm83::decoder::OpCode::Stop => Instruction::Stop,
             sm83::decoder::OpCode::Illegal => Instruction::Illegal,
-            sm83::decoder::OpCode::Rlc(mode) => {
-                Instruction::Rlc(translate_addr_mode(&mut self.iter, mode))
-            }
-            sm83::decoder::OpCode::Rrc(mode) => {
-                Instruction::Rrc(translate_addr_mode(&mut self.iter, mode))
-            }
-            sm83::decoder::OpCode::Rl(mode) => {
-                Instruction::Rl(translate_addr_mode(&mut self.iter, mode))
-            }
-            sm83::decoder::OpCode::Rr(mode) => {
-                Instruction::Rr(translate_addr_mode(&mut self.iter, mode))
-            }
-            sm83::decoder::OpCode::Sla(mode) => {
-                Instruction::Sla(translate_addr_mode(&mut self.iter, mode))
-            }
-            sm83::decoder::OpCode::Sra(mode) => {
-                Instruction::Sra(translate_addr_mode(&mut self.iter, mode))
-            }
-            sm83::decoder::OpCode::Swap(mode) => {
-                Instruction::Swap(translate_addr_mode(&mut self.iter, mode))
-            }
-            sm83::decoder::OpCode::Srl(mode) => {
-                Instruction::Srl(translate_addr_mode(&mut self.iter, mode))
-            }
+            sm83::decoder::OpCode::Rlc(mode) => Instruction::Rlc(self.read_addr_mode(mode)),
+            sm83::decoder::OpCode::Rrc(mode) => Instruction::Rrc(self.read_addr_mode(mode)),
+            sm83::decoder::OpCode::Rl(mode) => Instruction::Rl(self.read_addr_mode(mode)),
+            sm83::decoder::OpCode::Rr(mode) => Instruction::Rr(self.read_addr_mode(mode)),
+            sm83::decoder::OpCode::Sla(mode) => Instruction::Sla(self.read_addr_mode(mode)),
+            sm83::decoder::OpCode::Sra(mode) => Instruction::Sra(self.read_addr_mode(mode)),
+            sm83::decoder::OpCode::Swap(mode) => Instruction::Swap(self.read_addr_mode(mode)),
+            sm83::decoder::OpCode::Srl(mode) => Instruction::Srl(self.read_addr_mode(mode)),
             sm83::decoder::OpCode::Bit(bit, mode) => {
-                Instruction::Bit(bit, translate_addr_mode(&mut self.iter, mode))
+                Instruction::Bit(bit, self.read_addr_mode(mode))
             }
             sm83::decoder::OpCode::Res(bit, mode) => {
-                Instruction::Res(bit, translate_addr_mode(&mut self.iter, mode))
+                Instruction::Res(bit, self.read_addr_mode(mode))
             }
             sm83::decoder::OpCode::Set(bit, mode) => {
-                Instruction::Set(bit, translate_addr_mode(&mut self.iter, mode))
+                Instruction::Set(bit, self.read_addr_mode(mode))
             }
         };
         Some((addr, insn))
@@ -1,31 +1,30 @@
-use std::{ffi::OsStr, io::Write};
+use std::{ffi::OsStr, fmt::Write};
 
 fn main() {
     let out_dir = std::env::var("OUT_DIR").unwrap();
     let test_file = std::path::Path::new(&out_dir).join("generated_tests.rs");
-    let mut f = std::fs::File::create(test_file).unwrap();
+    let mut generated = String::new();
 
-    let test_suites = std::fs::read_dir("tests/data")
-        .unwrap()
-        .filter_map(|entry| {
-            let entry = entry.unwrap();
-            let file_type = entry.file_type().unwrap();
-            let path = entry.path();
-            if file_type.is_file() && path.extension().is_some_and(|e| e == OsStr::new("toml")) {
-                Some(path)
-            } else {
-                None
-            }
-        });
+    // Resolving the data directory once yields absolute paths for every entry it contains
+    let data_dir = std::path::Path::new("tests/data").canonicalize().unwrap();
+    let test_suites = std::fs::read_dir(data_dir).unwrap().filter_map(|entry| {
+        let entry = entry.unwrap();
+        let file_type = entry.file_type().unwrap();
+        let path = entry.path();
+        if file_type.is_file() && path.extension().is_some_and(|e| e == OsStr::new("toml")) {
+            Some(path)
+        } else {
+            None
+        }
+    });
 
     println!("cargo:rerun-if-changed=tests/data");
 
     for test_suite in test_suites {
         let test_suite_name = test_suite.file_stem().and_then(|e| e.to_str()).unwrap();
-        let test_file = test_suite.canonicalize().unwrap();
 
         write!(
-            f,
+            generated,
             "
 #[test]
 fn {test_suite_name}_test() {{
@@ -34,8 +33,14 @@ fn {test_suite_name}_test() {{
     run_test(test_suite, tests);
 }}",
             test_suite_name = test_suite_name,
-            test_file = test_file.display()
+            test_file = test_suite.display()
         )
         .unwrap();
     }
+
+    // Write the whole file at once instead of issuing a write for every test suite, and leave it
+    // untouched if the previous run already generated the same contents
+    if std::fs::read_to_string(&test_file).ok().as_deref() != Some(generated.as_str()) {
+        std::fs::write(test_file, generated).unwrap();
+    }
 }
@@ -118,6 +118,9 @@ mod generated {
     use super::{AddressingMode, OpCode};
     use sm83_decoder_macros::generate_decoder_tables;
 
+    /// Operand of every instruction that accesses memory through `[HL]`.
+    const INDIRECT_HL: AddressingMode = AddressingMode::IndirectRegister(super::RegisterPair::HL);
+
     impl RegisterPair {
         pub const fn into_generalized(self) -> super::RegisterPair {
             match self {
@@ -209,11 +212,11 @@ mod generated {
         }
         DECODER_TABLE: [OpCode; 256] {
             [r: Register, R: Register] "01rrrRRR" => { OpCode::Ld8(AddressingMode::Register(#r), AddressingMode::Register(#R)) },
-            [r: Register] "01rrr110" => { OpCode::Ld8(AddressingMode::Register(#r), AddressingMode::IndirectRegister(super::RegisterPair::HL)) },
-            [R: Register] "01110RRR" => { OpCode::Ld8(AddressingMode::IndirectRegister(RegisterPair::HL.into_generalized()), AddressingMode::Register(#R)) },
+            [r: Register] "01rrr110" => { OpCode::Ld8(AddressingMode::Register(#r), INDIRECT_HL) },
+            [R: Register] "01110RRR" => { OpCode::Ld8(INDIRECT_HL, AddressingMode::Register(#R)) },
             [] "01110110" => { OpCode::Halt },
             [r: Register] "00rrr110" => { OpCode::Ld8(AddressingMode::Register(#r), AddressingMode::Immediate) },
-            [] "00110110" => { OpCode::Ld8(AddressingMode::IndirectRegister(RegisterPair::HL.into_generalized()), AddressingMode::Immediate) },
+            [] "00110110" => { OpCode::Ld8(INDIRECT_HL, AddressingMode::Immediate) },
             [r: Register] "10000rrr" => { OpCode::Add8(AddressingMode::Register(Register::A), AddressingMode::Register(#r)) },
             [r: Register] "10010rrr" => { OpCode::Sub8(AddressingMode::Register(Register::A), AddressingMode::Register(#r)) },
             [r: Register] "10100rrr" => { OpCode::And8(AddressingMode::Register(Register::A), AddressingMode::Register(#r)) },
@@ -274,16 +277,16 @@ mod generated {
             [] "11111001" => { OpCode::Ld16(AddressingMode::RegisterPair(super::RegisterPair::SP), AddressingMode::RegisterPair(super::RegisterPair::HL)) },
             [] "11110011" => { OpCode::Di },
             [] "11111011" => { OpCode::Ei },
-            [] "00110100" => { OpCode::Inc8(AddressingMode::IndirectRegister(super::RegisterPair::HL)) },
-            [] "00110101" => { OpCode::Dec8(AddressingMode::IndirectRegister(super::RegisterPair::HL)) },
-            [] "10000110" => { OpCode::Add8(AddressingMode::Register(Register::A), AddressingMode::IndirectRegister(super::RegisterPair::HL)) },
-            [] "10001110" => { OpCode::Adc8(AddressingMode::Register(Register::A), AddressingMode::IndirectRegister(super::RegisterPair::HL)) },
-            [] "10010110" => { OpCode::Sub8(AddressingMode::Register(Register::A), AddressingMode::IndirectRegister(super::RegisterPair::HL)) },
-            [] "10011110" => { OpCode::Sbc8(AddressingMode::Register(Register::A), AddressingMode::IndirectRegister(super::RegisterPair::HL)) },
-            [] "10100110" => { OpCode::And8(AddressingMode::Register(Register::A), AddressingMode::IndirectRegister(super::RegisterPair::HL)) },
-            [] "10101110" => { OpCode::Xor8(AddressingMode::Register(Register::A), AddressingMode::IndirectRegister(super::RegisterPair::HL)) },
-            [] "10110110" => { OpCode::Or8(AddressingMode::Register(Register::A), AddressingMode::IndirectRegister(super::RegisterPair::HL)) },
-            [] "10111110" => { OpCode::Cp8(AddressingMode::Register(Register::A), AddressingMode::IndirectRegister(super::RegisterPair::HL)) },
+            [] "00110100" => { OpCode::Inc8(INDIRECT_HL) },
+            [] "00110101" => { OpCode::Dec8(INDIRECT_HL) },
+            [] "10000110" => { OpCode::Add8(AddressingMode::Register(Register::A), INDIRECT_HL) },
+            [] "10001110" => { OpCode::Adc8(AddressingMode::Register(Register::A), INDIRECT_HL) },
+            [] "10010110" => { OpCode::Sub8(AddressingMode::Register(Register::A), INDIRECT_HL) },
+            [] "10011110" => { OpCode::Sbc8(AddressingMode::Register(Register::A), INDIRECT_HL) },
+            [] "10100110" => { OpCode::And8(AddressingMode::Register(Register::A), INDIRECT_HL) },
+            [] "10101110" => { OpCode::Xor8(AddressingMode::Register(Register::A), INDIRECT_HL) },
+            [] "10110110" => { OpCode::Or8(AddressingMode::Register(Register::A), INDIRECT_HL) },
+            [] "10111110" => { OpCode::Cp8(AddressingMode::Register(Register::A), INDIRECT_HL) },
             [] "11010011" => { OpCode::Illegal },
             [] "11100011" => { OpCode::Illegal },
             [] "11100100" => { OpCode::Illegal },
@@ -305,20 +308,20 @@ mod generated {
             [r: Register] "00101rrr" => { OpCode::Sra(AddressingMode::Register(#r)) },
             [r: Register] "00110rrr" => { OpCode::Swap(AddressingMode::Register(#r)) },
             [r: Register] "00111rrr" => { OpCode::Srl(AddressingMode::Register(#r)) },
-            [] "00000110" => { OpCode::Rlc(AddressingMode::IndirectRegister(super::RegisterPair::HL)) },
-            [] "00001110" => { OpCode::Rrc(AddressingMode::IndirectRegister(super::RegisterPair::HL)) },
-            [] "00010110" => { OpCode::Rl(AddressingMode::IndirectRegister(super::RegisterPair::HL)) },
-            [] "00011110" => { OpCode::Rr(AddressingMode::IndirectRegister(super::RegisterPair::HL)) },
-            [] "00100110" => { OpCode::Sla(AddressingMode::IndirectRegister(super::RegisterPair::HL)) },
-            [] "00101110" => { OpCode::Sra(AddressingMode::IndirectRegister(super::RegisterPair::HL)) },
-            [] "00110110" => { OpCode::Swap(AddressingMode::IndirectRegister(super::RegisterPair::HL)) },
-            [] "00111110" => { OpCode::Srl(AddressingMode::IndirectRegister(super::RegisterPair::HL)) },
+            [] "00000110" => { OpCode::Rlc(INDIRECT_HL) },
+            [] "00001110" => { OpCode::Rrc(INDIRECT_HL) },
+            [] "00010110" => { OpCode::Rl(INDIRECT_HL) },
+            [] "00011110" => { OpCode::Rr(INDIRECT_HL) },
+            [] "00100110" => { OpCode::Sla(INDIRECT_HL) },
+            [] "00101110" => { OpCode::Sra(INDIRECT_HL) },
+            [] "00110110" => { OpCode::Swap(INDIRECT_HL) },
+            [] "00111110" => { OpCode::Srl(INDIRECT_HL) },
             [r: Register, b: Bit] "01bbbrrr" => { OpCode::Bit(#b, AddressingMode::Register(#r)) },
             [r: Register, b: Bit] "10bbbrrr" => { OpCode::Res(#b, AddressingMode::Register(#r)) },
             [r: Register, b: Bit] "11bbbrrr" => { OpCode::Set(#b, AddressingMode::Register(#r)) },
-            [b: Bit] "01bbb110" => { OpCode::Bit(#b, AddressingMode::IndirectRegister(super::RegisterPair::HL)) },
-            [b: Bit] "10bbb110" => { OpCode::Res(#b, AddressingMode::IndirectRegister(super::RegisterPair::HL)) },
-            [b: Bit] "11bbb110" => { OpCode::Set(#b, AddressingMode::IndirectRegister(super::RegisterPair::HL)) },
+            [b: Bit] "01bbb110" => { OpCode::Bit(#b, INDIRECT_HL) },
+            [b: Bit] "10bbb110" => { OpCode::Res(#b, INDIRECT_HL) },
+            [b: Bit] "11bbb110" => { OpCode::Set(#b, INDIRECT_HL) },
         },
     }
 }
@@ -142,10 +142,9 @@ struct Test {
 }
 
 fn parse_u16(string: &str) -> u16 {
-    if string.starts_with("0x") {
-        u16::from_str_radix(string.trim_start_matches("0x"), 16).unwrap()
-    } else {
-        u16::from_str_radix(string, 10).unwrap()
+    match string.strip_prefix("0x") {
+        Some(hex) => u16::from_str_radix(hex, 16).unwrap(),
+        None => string.parse().unwrap(),
     }
 }
 
@@ -231,6 +230,7 @@ fn run_test(test_suite_name: &str, tests_str: &str) {
         };
 
         let mut active_interrupts = Interrupts::new();
+        let expected_cycles = Cycles::new(test.cycles);
         let mut executed_cycles = Cycles::new(0);
         let exit_reason = loop {
             let interrupts = if let Some(interrupts) = test
@@ -277,7 +277,7 @@ fn run_test(test_suite_name: &str, tests_str: &str) {
                 executed_cycles, test_suite_name, test_case
             );
 
-            if executed_cycles >= Cycles::new(test.cycles) {
+            if executed_cycles >= expected_cycles {
                 break reason;
             }
         };
@@ -312,11 +312,9 @@ fn run_test(test_suite_name: &str, tests_str: &str) {
         );
 
         assert_eq!(
-            Cycles::new(test.cycles),
-            executed_cycles,
+            expected_cycles, executed_cycles,
             "Did not run for the expected number of cycles in test `{}::{}` (expected != actual)",
-            test_suite_name,
-            test_case
+            test_suite_name, test_case
         );
 
         assert_eq!(
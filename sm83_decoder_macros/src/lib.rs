@@ -63,62 +63,74 @@ impl Parse for DecodingStatement {
     }
 }
 
-struct Field<'a> {
+struct Field {
     msb: usize,
     lsb: usize,
-    ty: &'a Declaration,
     var_name: char,
+    // Values of the declared type, already shifted into place within the opcode
+    shifted_values: Vec<usize>,
+    // `Type::Member` paths of the declared type, in the same order as `shifted_values`
+    replacements: Vec<TokenStream>,
 }
 
-impl<'a> Field<'a> {
+impl Field {
     fn value_mask(&self) -> usize {
         1 << (self.msb - self.lsb + 1)
     }
 }
 
+/// A bit pattern parsed once into its fixed bits and the bit range taken by each variable.
+struct BitPattern {
+    fixed_bits: usize,
+    // Maps each variable to its (msb, lsb) range
+    slots: HashMap<char, (usize, usize)>,
+}
+
+impl BitPattern {
+    fn parse(bit_pattern: &syn::LitStr) -> syn::Result<Self> {
+        let bit_pattern_str = bit_pattern.value();
+        let len = bit_pattern_str.len();
+
+        let mut fixed_bits = 0;
+        let mut slots: HashMap<char, (usize, usize)> = HashMap::new();
+        let mut previous = None;
+        for (idx, c) in bit_pattern_str.chars().enumerate() {
+            let bit = len - idx - 1;
+            match c {
+                '0' => {}
+                '1' => fixed_bits |= 1 << bit,
+                _ => {
+                    if let Some((_, lsb)) = slots.get_mut(&c) {
+                        if previous != Some(c) {
+                            let message = format!("Bit pattern is not contiguous! `{}`", c);
+                            return Err(syn::Error::new(bit_pattern.span(), message));
+                        }
+                        *lsb = bit;
+                    } else {
+                        slots.insert(c, (bit, bit));
+                    }
+                }
+            }
+            previous = Some(c);
+        }
+
+        Ok(Self { fixed_bits, slots })
+    }
+}
+
 impl DecodingStatement {
-    fn generate_field_from_pattern<'a>(
+    fn generate_field_from_pattern(
         bit_pattern: &syn::LitStr,
+        pattern: &BitPattern,
         var_decl: &VarDecl,
-        type_decls: &'a Declarations,
-    ) -> syn::Result<Field<'a>> {
-        let bit_pattern_str = bit_pattern.value();
+        type_decls: &Declarations,
+    ) -> syn::Result<Field> {
         let expected_char = var_decl.var_ident.to_string().chars().next().unwrap();
 
-        let msb = bit_pattern_str
-            .chars()
-            .enumerate()
-            .find(|(_, c)| *c == expected_char)
-            .map(|(idx, _)| bit_pattern_str.len() - idx - 1);
-
-        if msb.is_none() {
+        let Some(&(msb, lsb)) = pattern.slots.get(&expected_char) else {
             let message = format!("Bit pattern does not use variable {}", expected_char);
             return Err(syn::Error::new(bit_pattern.span(), message));
-        }
-
-        let lsb = bit_pattern_str
-            .chars()
-            .rev()
-            .enumerate()
-            .find(|(_, c)| *c == expected_char)
-            .map(|(idx, _)| idx);
-
-        // At this point we know that both are valid (if msb is found, lsb must also be found),
-        // so unwrapping is fine
-        let lsb = lsb.unwrap();
-        let msb = msb.unwrap();
-
-        let is_range_contiguous = bit_pattern_str
-            .chars()
-            .rev()
-            .skip(lsb)
-            .take(msb - lsb + 1)
-            .all(|current| current == expected_char);
-
-        if !is_range_contiguous {
-            let message = format!("Bit pattern is not contiguous! `{}`", expected_char);
-            return Err(syn::Error::new(bit_pattern.span(), message));
-        }
+        };
 
         let ty = type_decls.find_type(&var_decl.ty);
         if ty.is_none() {
@@ -127,15 +139,16 @@ impl DecodingStatement {
         }
         let ty = ty.unwrap();
 
-        let field = Field {
+        let mut field = Field {
             msb,
             lsb,
-            ty,
             var_name: expected_char,
+            shifted_values: Vec::with_capacity(ty.values.len()),
+            replacements: Vec::with_capacity(ty.values.len()),
         };
 
         for decl_val in &ty.values {
-            let parsed_val: usize = decl_val.value.base10_parse()?;
+            let parsed_val = decl_val.parsed_value;
             if (parsed_val & field.value_mask()) != 0 {
                 let message = format!(
                     "Cannot fit value {} of variable {}",
@@ -143,6 +156,13 @@ impl DecodingStatement {
                 );
                 return Err(syn::Error::new(bit_pattern.span(), message));
             }
+            field.shifted_values.push(parsed_val << lsb);
+
+            let type_ident = &ty.ident;
+            let member_ident = &decl_val.label;
+            field.replacements.push(quote::quote! {
+                #type_ident::#member_ident
+            });
         }
 
         Ok(field)
@@ -150,7 +170,7 @@ impl DecodingStatement {
 
     fn map_tokens(
         stream: TokenStream,
-        replacements: &HashMap<char, TokenStream>,
+        replacements: &HashMap<char, &TokenStream>,
     ) -> syn::Result<TokenStream> {
         let mut result = TokenStream::new();
         let mut iter = stream.into_iter();
@@ -210,82 +230,59 @@ impl DecodingStatement {
         var_indexes: &[usize],
         fields: &[Field],
     ) -> syn::Result<TokenStream> {
-        let mut replacements = HashMap::new();
-        for (idx, field) in var_indexes.iter().zip(fields.iter()) {
-            let type_ident = &field.ty.ident;
-            let member_ident = &field.ty.values[*idx].label;
-            let var_name = &field.var_name;
-
-            let stream = quote::quote! {
-                #type_ident::#member_ident
-            };
-
-            replacements.insert(*var_name, stream);
-        }
+        let replacements = var_indexes
+            .iter()
+            .zip(fields.iter())
+            .map(|(idx, field)| (field.var_name, &field.replacements[*idx]))
+            .collect();
 
         Self::map_tokens(self.body.clone(), &replacements)
     }
 
-    fn generate_map_entries(
+    fn generate_table_entries(
         &self,
         types: &Declarations,
-    ) -> syn::Result<HashMap<usize, DecoderRow>> {
+        table: &mut [Option<DecoderRow>],
+    ) -> syn::Result<()> {
         let mut fields = vec![];
         let mut var_indexes = vec![];
 
-        // Reverses the pattern to start on lsb
-        let mut zeroed_pattern: String = self.bit_pattern.value().chars().rev().collect();
+        let pattern = BitPattern::parse(&self.bit_pattern)?;
 
         // We need to take the variables and create all combinatorics for each variable.
         for var_decl in &self.var_decls {
-            let field = Self::generate_field_from_pattern(&self.bit_pattern, var_decl, types)?;
-
-            zeroed_pattern = zeroed_pattern
-                .chars()
-                .enumerate()
-                .map(|(idx, c)| {
-                    if idx >= field.lsb && idx <= field.msb {
-                        '0'
-                    } else {
-                        c
-                    }
-                })
-                .collect();
-
+            let field =
+                Self::generate_field_from_pattern(&self.bit_pattern, &pattern, var_decl, types)?;
             fields.push(field);
             var_indexes.push(0_usize);
         }
 
-        // Reverses the pattern to start on msb and parses it.
-        let zeroed_pattern: String = zeroed_pattern.chars().rev().collect();
-        let zeroed_pattern = usize::from_str_radix(&zeroed_pattern, 2).map_err(|_| {
-            syn::Error::new(self.bit_pattern.span(), "Pattern contains unexpanded data")
-        })?;
+        if pattern
+            .slots
+            .keys()
+            .any(|c| !fields.iter().any(|field| field.var_name == *c))
+        {
+            return Err(syn::Error::new(
+                self.bit_pattern.span(),
+                "Pattern contains unexpanded data",
+            ));
+        }
 
         let dims = fields.len();
 
-        let mut map = HashMap::new();
         'outer: loop {
-            let mut opcode = zeroed_pattern;
-            for (field, index) in fields.iter().zip(var_indexes.iter()) {
-                let field_val: usize = field
-                    .ty
-                    .values
-                    .iter()
-                    .nth(*index)
-                    .expect("Invalid field index! This is a bug in the macro!")
-                    .value
-                    .base10_parse()?;
-
-                opcode |= field_val << field.lsb;
-            }
-
-            map.insert(
-                opcode,
-                DecoderRow {
+            let opcode = fields
+                .iter()
+                .zip(var_indexes.iter())
+                .fold(pattern.fixed_bits, |opcode, (field, index)| {
+                    opcode | field.shifted_values[*index]
+                });
+
+            if let Some(entry) = table.get_mut(opcode) {
+                *entry = Some(DecoderRow {
                     token_stream: self.replace_vars_in_body(&var_indexes, &fields)?,
-                },
-            );
+                });
+            }
 
             // Trigger next permutation or exit
             let mut current_var = 0;
@@ -296,7 +293,7 @@ impl DecodingStatement {
 
                 let next_idx = var_indexes[current_var] + 1;
                 let field = &fields[current_var];
-                if next_idx == field.ty.values.len() {
+                if next_idx == field.shifted_values.len() {
                     var_indexes[current_var] = 0;
                     current_var += 1;
                 } else {
@@ -305,13 +302,15 @@ impl DecodingStatement {
                 }
             }
         }
-        Ok(map)
+        Ok(())
     }
 }
 
 struct DeclValue {
     label: syn::Ident,
     value: syn::LitInt,
+    // The value literal, parsed once when the declaration is read
+    parsed_value: usize,
 }
 
 impl Parse for DeclValue {
@@ -319,7 +318,12 @@ impl Parse for DeclValue {
         let label: syn::Ident = input.parse()?;
         let _: Token![=] = input.parse()?;
         let value: syn::LitInt = input.parse()?;
-        Ok(Self { label, value })
+        let parsed_value = value.base10_parse()?;
+        Ok(Self {
+            label,
+            value,
+            parsed_value,
+        })
     }
 }
 
@@ -346,7 +350,7 @@ impl Parse for Declaration {
                 known_labels.push(label);
             }
 
-            let value: usize = decl_val.value.base10_parse()?;
+            let value = decl_val.parsed_value;
             if known_values.iter().any(|v| *v == value) {
                 return Err(syn::Error::new(decl_val.value.span(), "Duplicated value"));
             } else {
@@ -438,19 +442,16 @@ impl DecoderTable {
         let element_type = &self.element_type;
         let table_size = &self.table_size;
 
-        let mut hash_table = HashMap::new();
+        let mut table: Vec<Option<DecoderRow>> = (0..self.table_size).map(|_| None).collect();
         for statement in &self.statements {
-            match statement.generate_map_entries(declarations) {
-                Err(err) => return err.to_compile_error(),
-                Ok(map_entries) => {
-                    hash_table.extend(map_entries.into_iter());
-                }
+            if let Err(err) = statement.generate_table_entries(declarations, &mut table) {
+                return err.to_compile_error();
             }
         }
 
         let mut entries = vec![];
-        for i in 0..self.table_size {
-            if let Some(entry) = hash_table.get(&i) {
+        for (i, entry) in table.iter().enumerate() {
+            if let Some(entry) = entry {
                 let stream = &entry.token_stream;
                 entries.push(quote::quote! { #stream });
             } else {